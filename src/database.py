@@ -1,21 +1,55 @@
 """Database connection and session management"""
 
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.pool import QueuePool
+import logging
+from contextvars import ContextVar
+from datetime import date
+from typing import List, Optional
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool, StaticPool
 from loguru import logger
 from config.settings import get_settings
 
 settings = get_settings()
 
+
+def _engine_options(database_url: str) -> dict:
+    """Pick pooling options suited to the database backend"""
+    if database_url.startswith("sqlite"):
+        if ":memory:" in database_url or database_url.rstrip("/") == "sqlite:":
+            # A single shared connection keeps the in-memory database alive
+            return {
+                "poolclass": StaticPool,
+                "connect_args": {"check_same_thread": False},
+            }
+        # SQLite serializes writes, so file databases skip the server pool sizing
+        # and keep SQLAlchemy's default small QueuePool; pooled connections
+        # retain their pragmas, page cache and mmap between sessions
+        return {}
+
+    return {
+        "poolclass": QueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+
+# Keep SQLAlchemy's statement logger quiet unless SQL echo is requested
+if not settings.sql_echo:
+    sql_logger = logging.getLogger("sqlalchemy.engine")
+    sql_logger.setLevel(logging.WARNING)
+    sql_logger.addHandler(logging.NullHandler())
+    sql_logger.propagate = False
+
 # Create database engine
 engine = create_engine(
     settings.database_url,
-    poolclass=QueuePool,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    echo=settings.debug,
+    echo=settings.sql_echo,
+    **_engine_options(settings.database_url),
 )
 
 # Create session factory
@@ -29,28 +63,50 @@ SessionLocal = sessionmaker(
 # Create declarative base for models
 Base = declarative_base()
 
+# Connectivity probe, compiled once and shared by every ping/health check
+PING = text("SELECT 1")
+
 
-# Enable foreign keys for SQLite (if using SQLite)
+# Enable foreign keys and write-friendly journaling for SQLite (if using SQLite)
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
-    """Enable foreign keys for SQLite"""
+    """Enable foreign keys, WAL journaling and cache tuning for SQLite"""
     if "sqlite" in settings.database_url:
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        # WAL lets readers proceed alongside the writer; NORMAL sync is safe in WAL mode
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB memory-mapped I/O
         cursor.close()
 
 
-def get_db():
-    """Dependency for getting database session"""
-    db = SessionLocal()
-    try:
-        yield db
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Database session error: {str(e)}")
-        raise
-    finally:
-        db.close()
+class RequestSession:
+    """Per-request slot holding a session that is only opened on first use"""
+    __slots__ = ("session",)
+
+    def __init__(self):
+        self.session: Optional[Session] = None
+
+
+# Request-scoped session slot, populated by DBSessionMiddleware
+db_session_context: ContextVar[Optional[RequestSession]] = ContextVar("db_session", default=None)
+
+
+def get_db() -> Session:
+    """Dependency for getting the current request's database session
+
+    The session is created lazily, so requests that never touch the
+    database never open one.
+    """
+    slot = db_session_context.get()
+    if slot is None:
+        raise RuntimeError("No request-scoped database session; is DBSessionMiddleware installed?")
+    if slot.session is None:
+        slot.session = SessionLocal()
+    return slot.session
 
 
 def init_db():
@@ -65,3 +121,53 @@ def drop_db():
     logger.warning("Dropping all database tables...")
     Base.metadata.drop_all(bind=engine)
     logger.warning("All tables dropped")
+
+
+def create_timeseries_partition(year: int, month: int) -> Optional[str]:
+    """Create the monthly timeseries_data partition for the given month (PostgreSQL only)"""
+    if engine.dialect.name != "postgresql":
+        return None
+
+    if not 1 <= month <= 12:
+        logger.error(f"Invalid partition month: {month}")
+        return None
+
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    partition_name = f"timeseries_data_{year:04d}_{month:02d}"
+
+    # DDL cannot take bind parameters; all interpolated values are validated integers
+    ddl = text(
+        f"CREATE TABLE IF NOT EXISTS {partition_name} PARTITION OF timeseries_data "
+        f"FOR VALUES FROM ('{year:04d}-{month:02d}-01') TO ('{next_year:04d}-{next_month:02d}-01')"
+    )
+
+    try:
+        with engine.begin() as connection:
+            connection.execute(ddl)
+        logger.info(f"Partition {partition_name} ready")
+        return partition_name
+    except Exception as e:
+        # Fails if the default partition already holds rows for this month
+        logger.error(f"Failed to create partition {partition_name}: {str(e)}")
+        return None
+
+
+def ensure_timeseries_partitions(today: Optional[date] = None) -> List[str]:
+    """Create this month's and next month's timeseries_data partitions
+
+    Run at startup so rows land in a monthly partition rather than the
+    default one, which would otherwise block creating that month later.
+    No-op outside PostgreSQL.
+    """
+    if engine.dialect.name != "postgresql":
+        return []
+
+    today = today or date.today()
+    next_year, next_month = (today.year + 1, 1) if today.month == 12 else (today.year, today.month + 1)
+
+    created = []
+    for year, month in ((today.year, today.month), (next_year, next_month)):
+        partition_name = create_timeseries_partition(year, month)
+        if partition_name:
+            created.append(partition_name)
+    return created
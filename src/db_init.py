@@ -1,23 +1,17 @@
-"""Database initialization and management utilities"""
+"""Database initialization and management utilities
 
-import os
-import sys
-from pathlib import Path
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+Run from the project root as a module, e.g. ``python -m src.db_init setup``.
+"""
 
 from loguru import logger
 
-# Force new settings instance
-if "config.settings" in sys.modules:
-    del sys.modules["config.settings"]
-
-from config.settings import Settings
-from src.database import init_db, drop_db, engine, Base
+from config.settings import get_settings
+from src.database import (
+    PING, init_db, drop_db, engine, Base,
+    create_timeseries_partition, ensure_timeseries_partitions,
+)
 
-# Create fresh settings without caching
-settings = Settings()
+settings = get_settings()
 
 
 def setup_database():
@@ -25,8 +19,9 @@ def setup_database():
     logger.info(f"Setting up database at: {settings.database_url}")
     
     try:
-        # Create all tables
+        # Create all tables and the current/next monthly partitions
         init_db()
+        ensure_timeseries_partitions()
         logger.success("✓ Database setup completed successfully")
         return True
     except Exception as e:
@@ -34,10 +29,13 @@ def setup_database():
         return False
 
 
-def reset_database():
-    """Reset the database - DROP and CREATE all tables"""
+def reset_database(force: bool = False):
+    """Reset the database - DROP and CREATE all tables
+
+    Prompts for confirmation unless ``force`` is set.
+    """
     logger.warning("⚠️  WARNING: This will DELETE all data from the database!")
-    confirm = input("Type 'yes' to confirm database reset: ")
+    confirm = "yes" if force else input("Type 'yes' to confirm database reset: ")
     
     if confirm.lower() == "yes":
         try:
@@ -57,9 +55,8 @@ def create_admin_user():
     """Create a default admin user for testing"""
     from src.models import User, UserRole
     from src.database import SessionLocal
-    from passlib.context import CryptContext
+    from src.security import PasswordManager
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     db = SessionLocal()
 
     try:
@@ -73,7 +70,7 @@ def create_admin_user():
         admin_user = User(
             username="admin",
             email="admin@financialanalytics.local",
-            hashed_password=pwd_context.hash("admin123"),
+            hashed_password=PasswordManager.hash_password("admin123"),
             full_name="System Administrator",
             role=UserRole.ADMIN,
             is_active=True,
@@ -98,7 +95,7 @@ def check_database_connection():
     """Check if database connection is working"""
     try:
         with engine.connect() as connection:
-            result = connection.execute("SELECT 1")
+            connection.execute(PING)
             logger.success("✓ Database connection successful")
             return True
     except Exception as e:
@@ -112,17 +109,32 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Database management utilities")
     parser.add_argument(
         "command",
-        choices=["setup", "reset", "check", "create-admin"],
+        choices=["setup", "reset", "check", "create-admin", "create-partition"],
         help="Command to execute",
     )
+    parser.add_argument(
+        "--yes", "--force",
+        dest="yes",
+        action="store_true",
+        help="Skip the confirmation prompt (reset)",
+    )
+    parser.add_argument("--year", type=int, help="Partition year (create-partition)")
+    parser.add_argument("--month", type=int, help="Partition month 1-12 (create-partition)")
 
     args = parser.parse_args()
 
     if args.command == "setup":
         setup_database()
     elif args.command == "reset":
-        reset_database()
+        reset_database(force=args.yes)
     elif args.command == "check":
         check_database_connection()
     elif args.command == "create-admin":
         create_admin_user()
+    elif args.command == "create-partition":
+        if args.year is None or args.month is None:
+            parser.error("create-partition requires --year and --month")
+        if engine.dialect.name != "postgresql":
+            logger.warning("Time-series partitioning is only supported on PostgreSQL")
+        elif create_timeseries_partition(args.year, args.month):
+            logger.success(f"✓ Partition for {args.year:04d}-{args.month:02d} ready")
@@ -2,6 +2,7 @@
 
 import sys
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -9,34 +10,66 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from loguru import logger
+import orjson
 from jose import JWTError
 
 from config.settings import get_settings
+from src.database import PING, engine, ensure_timeseries_partitions, init_db
+from src.middleware.db_session import DBSessionMiddleware
 from src.routes import auth, data
 
 # Configure logger
 settings = get_settings()
 logger.remove()
+# enqueue=True hands records to a background writer so logging never blocks a request
 logger.add(
     sys.stderr,
     format=settings.log_format,
-    level=settings.log_level
+    level=settings.log_level,
+    enqueue=True
 )
 logger.add(
     "logs/app.log",
-    format=settings.log_format,
+    format="{time} {level} {name}:{function}:{line} - {message}",
     level=settings.log_level,
-    rotation="500 MB"
+    rotation="500 MB",
+    enqueue=True,
+    serialize=False
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the database on startup and release pooled connections on shutdown"""
+    logger.info(f"Application started: {settings.app_name} v{settings.app_version}")
+    logger.debug(f"Debug mode: {settings.debug}")
+    logger.debug(f"Database: {settings.database_url}")
+
+    # Create missing tables (and, on PostgreSQL, the current and next monthly
+    # time-series partitions), then open a first connection so the pool and
+    # per-connection pragmas are ready before the first request arrives
+    init_db()
+    ensure_timeseries_partitions()
+    with engine.connect() as connection:
+        connection.execute(PING)
+
+    yield
+
+    logger.info(f"Application shutting down")
+    engine.dispose()
+    # Flush records still waiting in the background logging queue
+    await logger.complete()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="API-driven analytics platform for financial forecasting and risk assessment",
     debug=settings.debug,
+    lifespan=lifespan,
     openapi_tags=[
         {
             "name": "Authentication",
@@ -62,6 +95,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Share one database session per request across all dependencies
+app.add_middleware(DBSessionMiddleware)
+
 # Global exception handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
@@ -102,28 +138,33 @@ async def general_exception_handler(request: Request, exc: Exception):
         },
     )
 
+# Static response bodies, serialized once since they only depend on settings
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "app": settings.app_name,
+    "version": settings.app_version
+})
+
+_ROOT_BODY = orjson.dumps({
+    "message": f"Welcome to {settings.app_name}",
+    "version": settings.app_version,
+    "docs": "/docs",
+    "api_endpoints": {
+        "health": "/health",
+        "authentication": "/api/v1/auth"
+    }
+})
+
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "app": settings.app_name,
-        "version": settings.app_version
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint"""
-    return {
-        "message": f"Welcome to {settings.app_name}",
-        "version": settings.app_version,
-        "docs": "/docs",
-        "api_endpoints": {
-            "health": "/health",
-            "authentication": "/api/v1/auth"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 # Include routers
 app.include_router(auth.router)
@@ -132,18 +173,6 @@ app.include_router(data.router)
 # Import other routers (will be created in later tasks)
 # from src.routes import data_ingestion, forecasting, risk_analytics, kpi
 
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup"""
-    logger.info(f"Application started: {settings.app_name} v{settings.app_version}")
-    logger.debug(f"Debug mode: {settings.debug}")
-    logger.debug(f"Database: {settings.database_url}")
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown"""
-    logger.info(f"Application shutting down")
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -0,0 +1,53 @@
+"""Request-scoped database session middleware"""
+
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.database import RequestSession, db_session_context
+
+
+class DBSessionMiddleware:
+    """Share one lazily created session with every dependency of a request
+
+    Plain ASGI middleware: it only installs an empty ``RequestSession`` slot,
+    and ``get_db`` opens the session on first use. If a session was opened,
+    it is committed just before a non-error response starts, rolled back on
+    an error status or exception, and always closed.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        slot = RequestSession()
+        token = db_session_context.set(slot)
+        finished = False
+
+        async def send_wrapper(message: Message):
+            nonlocal finished
+            if message["type"] == "http.response.start" and not finished:
+                # Settle the transaction before the client sees the status,
+                # so a failed commit still surfaces as a server error
+                finished = True
+                if slot.session is not None:
+                    if message["status"] < 400:
+                        slot.session.commit()
+                    else:
+                        slot.session.rollback()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            if slot.session is not None:
+                slot.session.rollback()
+                logger.error(f"Database session error: {str(e)}")
+            raise
+        finally:
+            if slot.session is not None:
+                slot.session.close()
+            db_session_context.reset(token)
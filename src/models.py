@@ -1,18 +1,135 @@
 """SQLAlchemy database models for the application"""
 
-from datetime import datetime
 from sqlalchemy import (
     Column, String, Integer, Float, DateTime, 
     Boolean, Text, ForeignKey, Index, JSON, 
-    Enum as SQLEnum
+    LargeBinary, CheckConstraint, DDL, event, Enum as SQLEnum
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
 from enum import Enum
+import json
+import msgpack
 import uuid
 
 from src.database import Base
 
 
+class GUID(TypeDecorator[uuid.UUID]):
+    """UUID stored as a compact 16-byte binary value
+
+    Columns using it carry an explicit ``Column[uuid.UUID]`` annotation:
+    a TypeDecorator is also a SchemaEventTarget, so mypy cannot infer the
+    column type from ``Column(GUID())`` on its own.
+
+    Accepts ``uuid.UUID`` instances, their string form, or 16 raw bytes
+    (e.g. ``os.urandom(16)`` on bulk paths) on the way in and always
+    returns ``uuid.UUID`` on the way out.
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, bytes) and len(value) == 16:
+            return value
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        return value.bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return uuid.UUID(bytes=bytes(value))
+
+
+def _json_compatible(value):
+    """Stringify mapping keys the way ``json.dumps`` does, recursively"""
+    if isinstance(value, dict):
+        return {_json_key(key): _json_compatible(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_compatible(item) for item in value]
+    return value
+
+
+def _json_key(key):
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (bool, int, float)):
+        return json.dumps(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+class MsgpackBlob(TypeDecorator):
+    """JSON-compatible value stored as a msgpack-encoded binary blob
+
+    Non-string keys are converted to strings on write, matching the JSON
+    and JSONB variants.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return msgpack.packb(_json_compatible(value), use_bin_type=True)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return msgpack.unpackb(value, raw=False)
+
+
+# Binary JSON storage: JSONB on PostgreSQL, msgpack on SQLite, plain JSON elsewhere
+CompactJSON = JSON().with_variant(JSONB(), "postgresql").with_variant(MsgpackBlob(), "sqlite")
+
+
+class EnumString(TypeDecorator):
+    """Enum stored as a plain string of its value, loaded back as an enum member"""
+    impl = String
+    cache_ok = True
+
+    def __init__(self, enum_cls):
+        self.enum_cls = enum_cls
+        super().__init__(length=max(len(member.value) for member in enum_cls))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_cls(value).value
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self.enum_cls(value)
+
+
+def enum_column_type(enum_cls, name):
+    """Native ENUM type on PostgreSQL, ``EnumString`` elsewhere
+
+    Values (not member names) are stored so both backends hold the same labels,
+    and both load them back as ``enum_cls`` members.
+    Pair with ``enum_check_constraint`` to validate values outside PostgreSQL.
+    """
+    native = SQLEnum(
+        enum_cls,
+        name=name,
+        native_enum=True,
+        create_constraint=False,
+        values_callable=lambda members: [member.value for member in members],
+    )
+    return EnumString(enum_cls).with_variant(native, "postgresql")
+
+
+def enum_check_constraint(column, enum_cls, name):
+    """CHECK constraint restricting a string enum column, emitted on SQLite only"""
+    allowed = ", ".join(f"'{member.value}'" for member in enum_cls)
+    return CheckConstraint(f"{column} IN ({allowed})", name=name).ddl_if(dialect="sqlite")
+
+
 class UserRole(str, Enum):
     """User role enumeration"""
     ADMIN = "admin"
@@ -42,23 +159,22 @@ class User(Base):
     """User model for authentication and authorization"""
     __tablename__ = "users"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
     username = Column(String(50), unique=True, nullable=False, index=True)
     email = Column(String(100), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
     full_name = Column(String(100))
-    role = Column(SQLEnum(UserRole), default=UserRole.VIEWER, nullable=False)
+    role = Column(enum_column_type(UserRole, "user_role"), default=UserRole.VIEWER, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), onupdate=func.current_timestamp())
 
     # Relationships
     data_uploads = relationship("DataUpload", back_populates="user", cascade="all, delete-orphan")
     trained_models = relationship("TrainedModel", back_populates="user", cascade="all, delete-orphan")
 
     __table_args__ = (
-        Index("idx_user_email", "email"),
-        Index("idx_user_username", "username"),
+        enum_check_constraint("role", UserRole, "ck_user_role"),
     )
 
 
@@ -66,8 +182,8 @@ class DataUpload(Base):
     """Data upload records"""
     __tablename__ = "data_uploads"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    user_id: Column[uuid.UUID] = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     filename = Column(String(255), nullable=False)
     data_type = Column(String(50), nullable=False)  # e.g., "financial_data", "time_series"
     rows_uploaded = Column(Integer, nullable=False, default=0)
@@ -75,10 +191,10 @@ class DataUpload(Base):
     status = Column(String(50), default="validated", nullable=False)  # validated, processing, error
     error_message = Column(Text)
     source = Column(String(100))
-    upload_metadata = Column(JSON)  # Store schema info, column names, original columns, etc.
-    schema_info = Column(JSON)  # Backwards-compatible: Store schema info, column names, etc.
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    upload_metadata = Column(CompactJSON)  # Store schema info, column names, original columns, etc.
+    schema_info = Column(CompactJSON)  # Backwards-compatible: Store schema info, column names, etc.
+    created_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), onupdate=func.current_timestamp())
 
     # Relationships
     user = relationship("User", back_populates="data_uploads")
@@ -91,43 +207,67 @@ class DataUpload(Base):
 
 
 class TimeSeriesData(Base):
-    """Time-series financial data storage"""
+    """Time-series financial data storage
+
+    On PostgreSQL the table is range-partitioned by ``timestamp`` into
+    monthly partitions. The application creates the current and next month's
+    partitions at startup; others can be created with
+    ``python -m src.db_init create-partition``. Rows outside every monthly
+    partition land in the default partition.
+    """
     __tablename__ = "timeseries_data"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    upload_id = Column(String(36), ForeignKey("data_uploads.id", ondelete="CASCADE"), nullable=False, index=True)
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
-    symbol = Column(String(50), nullable=False, index=True)
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    upload_id: Column[uuid.UUID] = Column(GUID(), ForeignKey("data_uploads.id", ondelete="CASCADE"), nullable=False)
+    user_id: Column[uuid.UUID] = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Part of the primary key because PostgreSQL requires the partition key in it
+    timestamp = Column(DateTime, primary_key=True, nullable=False)
+    symbol = Column(String(50), nullable=False)
     open_price = Column(Float)
     high_price = Column(Float)
     low_price = Column(Float)
     close_price = Column(Float)
     volume = Column(Integer)
     adjusted_close = Column(Float)
-    attributes = Column(JSON)  # Additional attributes/backwards compat
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    attributes = Column(CompactJSON)  # Additional attributes/backwards compat
+    created_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
 
     # Relationships
     data_upload = relationship("DataUpload", back_populates="timeseries_data")
     user = relationship("User")
 
     __table_args__ = (
-        Index("idx_ts_upload_id", "upload_id"),
+        # Covers per-upload range scans; also serves lookups on upload_id alone
+        Index(
+            "idx_ts_upload_symbol_ts", "upload_id", "symbol", "timestamp",
+            postgresql_include=["close_price", "adjusted_close"],
+        ),
         Index("idx_ts_timestamp", "timestamp"),
         Index("idx_ts_symbol_timestamp", "symbol", "timestamp"),
+        {"postgresql_partition_by": 'RANGE ("timestamp")'},
     )
 
 
+# Catch-all partition so inserts never fail for months without a dedicated partition
+event.listen(
+    TimeSeriesData.__table__,
+    "after_create",
+    DDL(
+        "CREATE TABLE IF NOT EXISTS timeseries_data_default "
+        "PARTITION OF timeseries_data DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class TrainedModel(Base):
     """Trained ML model metadata and versioning"""
     __tablename__ = "trained_models"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    user_id: Column[uuid.UUID] = Column(GUID(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     model_name = Column(String(100), nullable=False)
-    model_type = Column(SQLEnum(ModelType), nullable=False)
-    forecast_type = Column(SQLEnum(ForecastType), nullable=False)
+    model_type = Column(enum_column_type(ModelType, "model_type"), nullable=False)
+    forecast_type = Column(enum_column_type(ForecastType, "forecast_type"), nullable=False)
     version = Column(Integer, default=1, nullable=False)
     model_path = Column(String(255), nullable=False)  # Path to saved model file
     
@@ -139,12 +279,12 @@ class TrainedModel(Base):
     
     # Configuration
     training_data_count = Column(Integer)
-    model_params = Column(JSON)  # Store model hyperparameters
+    model_params = Column(CompactJSON)  # Store model hyperparameters
     
     # Status tracking
     is_active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), onupdate=func.current_timestamp())
 
     # Relationships
     user = relationship("User", back_populates="trained_models")
@@ -154,6 +294,8 @@ class TrainedModel(Base):
         Index("idx_model_user_id", "user_id"),
         Index("idx_model_name", "model_name"),
         Index("idx_model_active", "is_active"),
+        enum_check_constraint("model_type", ModelType, "ck_model_type"),
+        enum_check_constraint("forecast_type", ForecastType, "ck_model_forecast_type"),
     )
 
 
@@ -161,15 +303,15 @@ class Forecast(Base):
     """Generated forecasts"""
     __tablename__ = "forecasts"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    model_id = Column(String(36), ForeignKey("trained_models.id", ondelete="CASCADE"), nullable=False)
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    model_id: Column[uuid.UUID] = Column(GUID(), ForeignKey("trained_models.id", ondelete="CASCADE"), nullable=False)
     forecast_date = Column(DateTime, nullable=False)
     predicted_value = Column(Float, nullable=False)
     lower_confidence_interval = Column(Float)  # 95% CI lower bound
     upper_confidence_interval = Column(Float)  # 95% CI upper bound
     actual_value = Column(Float)  # Filled in later for backtesting
-    forecast_metadata = Column(JSON)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    forecast_metadata = Column(CompactJSON)
+    created_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
 
     # Relationships
     model = relationship("TrainedModel", back_populates="forecasts")
@@ -184,9 +326,9 @@ class RiskMetrics(Base):
     """Computed risk metrics and analytics"""
     __tablename__ = "risk_metrics"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    model_id = Column(String(36), ForeignKey("trained_models.id", ondelete="CASCADE"), nullable=False)
-    calculation_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    model_id: Column[uuid.UUID] = Column(GUID(), ForeignKey("trained_models.id", ondelete="CASCADE"), nullable=False)
+    calculation_date = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
     
     # Risk metrics
     volatility = Column(Float)  # Standard deviation
@@ -197,11 +339,11 @@ class RiskMetrics(Base):
     sharpe_ratio = Column(Float)  # Risk-adjusted return metric
     
     # Additional analytics
-    correlation_data = Column(JSON)  # Store correlations with other variables
-    scenario_data = Column(JSON)  # Monte Carlo simulation results
+    correlation_data = Column(CompactJSON)  # Store correlations with other variables
+    scenario_data = Column(CompactJSON)  # Monte Carlo simulation results
     
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), onupdate=func.current_timestamp())
 
     __table_args__ = (
         Index("idx_risk_model_id", "model_id"),
@@ -213,9 +355,9 @@ class KPIReport(Base):
     """Generated KPI reports"""
     __tablename__ = "kpi_reports"
 
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    model_id = Column(String(36), ForeignKey("trained_models.id", ondelete="CASCADE"), nullable=False)
-    report_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+    id: Column[uuid.UUID] = Column(GUID(), primary_key=True, default=uuid.uuid4)
+    model_id: Column[uuid.UUID] = Column(GUID(), ForeignKey("trained_models.id", ondelete="CASCADE"), nullable=False)
+    report_date = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
     report_period_start = Column(DateTime, nullable=False)
     report_period_end = Column(DateTime, nullable=False)
     
@@ -228,8 +370,8 @@ class KPIReport(Base):
     risk_adjusted_return = Column(Float)
     
     # Report data
-    report_data = Column(JSON)  # Full report data
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    report_data = Column(CompactJSON)  # Full report data
+    created_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
 
     __table_args__ = (
         Index("idx_kpi_model_id", "model_id"),
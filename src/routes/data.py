@@ -12,9 +12,9 @@ from src.database import get_db
 from src.models import DataUpload, TimeSeriesData
 from src.schemas_data import (
     DataUploadResponse, DataValidationResponse, PreprocessingConfig,
-    PreprocessingResponse, DataUploadRequest
+    PreprocessingResponse, DataUploadRequest, UploadListResponse
 )
-from src.services.data import DataValidator, DataPreprocessor
+from src.services.data import DataValidator, DataPreprocessor, TimeSeriesIngestor
 from src.middleware.rbac import get_current_user_id, Permission, require_permission
 
 router = APIRouter(
@@ -54,7 +54,7 @@ async def upload_data(
     
     Returns: Upload summary with row counts and status
     """
-    upload_id = str(uuid.uuid4())
+    upload_id = uuid.uuid4()
     
     try:
         # Read file
@@ -83,8 +83,6 @@ async def upload_data(
                 "original_columns": df.columns.tolist(),
                 "data_quality": validation_report["data_quality_score"]
             },
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
         )
         
         db.add(upload_record)
@@ -92,39 +90,22 @@ async def upload_data(
         # Store valid data
         stored_count = 0
         if len(valid_df) > 0:
-            for idx, row in valid_df.iterrows():
-                try:
-                    ts_data = TimeSeriesData(
-                        id=str(uuid.uuid4()),
-                        upload_id=upload_id,
-                        user_id=user_id,
-                        timestamp=pd.to_datetime(row['timestamp']),
-                        symbol=str(row['symbol']),
-                        open_price=float(row['open_price']),
-                        high_price=float(row['high_price']),
-                        low_price=float(row['low_price']),
-                        close_price=float(row['close_price']),
-                        volume=int(row['volume']),
-                        adjusted_close=float(row.get('adjusted_close')) if pd.notna(row.get('adjusted_close')) else None,
-                        created_at=datetime.now(timezone.utc)
-                    )
-                    db.add(ts_data)
-                    stored_count += 1
-                except Exception as e:
-                    logger.error(f"Error storing row {idx}: {str(e)}")
-                    continue
+            # The upload row must exist before its time-series rows reference it
+            db.flush()
+            rows = TimeSeriesIngestor.to_records(valid_df)
+            stored_count = TimeSeriesIngestor.bulk_insert(db, upload_id, user_id, rows)
         
         db.commit()
         
         logger.info(f"Upload {upload_id}: {stored_count} rows stored")
         
         return {
-            "upload_id": upload_id,
+            "upload_id": str(upload_id),
             "filename": file.filename,
             "rows_processed": len(df),
             "rows_stored": stored_count,
             "data_type": data_type,
-            "status": "success" if stored_count == len(valid_df) else "partial",
+            "status": "success",
             "message": f"Successfully stored {stored_count}/{len(df)} rows",
             "created_at": datetime.now(timezone.utc)
         }
@@ -182,7 +163,7 @@ async def validate_data(
     description="Apply preprocessing pipeline to stored data"
 )
 async def preprocess_data(
-    upload_id: str,
+    upload_id: uuid.UUID,
     config: PreprocessingConfig = PreprocessingConfig(),
     user_id: str = Depends(get_current_user_id),
     db: Session = Depends(get_db)
@@ -211,7 +192,7 @@ async def preprocess_data(
             )
         
         # Check authorization
-        if upload.user_id != user_id:
+        if str(upload.user_id) != user_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to preprocess this data"
@@ -255,7 +236,6 @@ async def preprocess_data(
             **(upload.upload_metadata or {}),
             "preprocessing": preprocess_report
         }
-        upload.updated_at = datetime.now(timezone.utc)
         db.commit()
         
         return {
@@ -278,6 +258,7 @@ async def preprocess_data(
 
 @router.get(
     "/uploads",
+    response_model=UploadListResponse,
     status_code=status.HTTP_200_OK,
     summary="List user's data uploads",
     description="Get list of all uploads by the current user"
@@ -309,7 +290,7 @@ async def list_uploads(
             "offset": offset,
             "uploads": [
                 {
-                    "upload_id": u.id,
+                    "upload_id": str(u.id),
                     "filename": u.filename,
                     "data_type": u.data_type,
                     "rows_uploaded": u.rows_uploaded,
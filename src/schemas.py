@@ -73,6 +73,11 @@ class UserResponse(BaseModel):
     class Config:
         from_attributes = True
     
+    @validator('id', pre=True)
+    def convert_id(cls, v):
+        """Convert UUID to its canonical string form"""
+        return str(v)
+
     @validator('created_at', 'updated_at', pre=True)
     def convert_datetime(cls, v):
         """Convert datetime to ISO format string"""
@@ -97,11 +97,30 @@ class DataUploadResponse(BaseModel):
     rows_processed: int = Field(..., description="Number of rows processed")
     rows_stored: int = Field(..., description="Number of rows successfully stored")
     data_type: str = Field(..., description="Type of data uploaded")
-    status: str = Field(..., description="Upload status (success, partial, failed)")
+    status: str = Field(..., description="Upload status (success)")
     message: str = Field(..., description="Status message")
     created_at: datetime = Field(..., description="Upload timestamp")
 
 
+class UploadSummary(BaseModel):
+    """Summary of a single data upload"""
+    upload_id: str = Field(..., description="Unique upload ID")
+    filename: str = Field(..., description="Original filename")
+    data_type: str = Field(..., description="Type of data uploaded")
+    rows_uploaded: int = Field(..., description="Number of rows in the uploaded file")
+    rows_valid: int = Field(..., description="Number of rows that passed validation")
+    status: str = Field(..., description="Upload status (completed, failed)")
+    created_at: str = Field(..., description="Upload timestamp (ISO 8601)")
+
+
+class UploadListResponse(BaseModel):
+    """Paginated list of a user's uploads"""
+    total: int = Field(..., description="Total number of uploads for the user")
+    limit: int = Field(..., description="Maximum number of uploads returned")
+    offset: int = Field(..., description="Number of uploads skipped")
+    uploads: List[UploadSummary] = Field(default_factory=list, description="Upload summaries")
+
+
 class PreprocessingConfig(BaseModel):
     """Configuration for data preprocessing"""
     handle_missing: str = Field("forward_fill", description="Strategy for missing values (forward_fill, interpolate, drop)")
@@ -61,17 +61,14 @@ class AuthenticationService:
             )
         
         # Create new user
-        user_id = str(uuid.uuid4())  # Explicit string conversion
         new_user = User(
-            id=user_id,  # Pass the string directly
+            id=uuid.uuid4(),
             username=user_data.username,
             email=user_data.email,
             full_name=user_data.full_name or user_data.username,
             hashed_password=PasswordManager.hash_password(user_data.password),
             role="user",
             is_active=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
         )
         
         try:
@@ -188,7 +185,6 @@ class AuthenticationService:
             raise InvalidCredentialsError("Current password is incorrect")
         
         user.hashed_password = PasswordManager.hash_password(password_data.new_password)
-        user.updated_at = datetime.now(timezone.utc)
         
         try:
             db.commit()
@@ -213,7 +209,6 @@ class AuthenticationService:
             Updated User object
         """
         user.is_active = False
-        user.updated_at = datetime.now(timezone.utc)
         
         try:
             db.commit()
@@ -238,7 +233,6 @@ class AuthenticationService:
             Updated User object
         """
         user.is_active = True
-        user.updated_at = datetime.now(timezone.utc)
         
         try:
             db.commit()
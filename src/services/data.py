@@ -2,11 +2,15 @@
 
 import pandas as pd
 import numpy as np
+import os
 from typing import Tuple, List, Dict, Any
 from loguru import logger
 from datetime import datetime, timezone
 from sklearn.ensemble import IsolationForest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
+from src.models import TimeSeriesData
 from src.schemas_data import TimeSeriesDataSchema, PreprocessingConfig
 
 
@@ -302,3 +306,78 @@ class DataPreprocessor:
         logger.info(f"Preprocessing complete: {rows_before} → {rows_after} rows")
         
         return df_processed, report
+
+
+class TimeSeriesIngestor:
+    """Bulk-loads validated time-series rows into the database"""
+    
+    PRICE_COLUMNS = ['open_price', 'high_price', 'low_price', 'close_price']
+    
+    @staticmethod
+    def to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Convert a validated DataFrame into insert-ready row dictionaries
+        
+        Columns are converted in bulk so no ORM instances are needed.
+        Timestamps are parsed with ``format="mixed"`` because the validator
+        accepts each row's timestamp format independently.
+        
+        Args:
+            df: DataFrame that passed DataValidator.validate_timeseries_data
+            
+        Returns:
+            List of dictionaries keyed by TimeSeriesData column names
+        """
+        columns: Dict[str, List[Any]] = {
+            "timestamp": list(pd.to_datetime(df["timestamp"], format="mixed").dt.to_pydatetime()),
+            "symbol": df["symbol"].astype(str).tolist(),
+        }
+        for col in TimeSeriesIngestor.PRICE_COLUMNS:
+            columns[col] = df[col].astype(float).tolist()
+        columns["volume"] = df["volume"].astype(np.int64).tolist()
+        
+        if "adjusted_close" in df.columns:
+            adjusted = df["adjusted_close"].astype(float)
+            columns["adjusted_close"] = adjusted.astype(object).where(adjusted.notna(), None).tolist()
+        else:
+            columns["adjusted_close"] = [None] * len(df)
+        
+        keys = list(columns)
+        return [dict(zip(keys, values)) for values in zip(*columns.values())]
+    
+    @staticmethod
+    def bulk_insert(db: Session, upload_id: Any, user_id: Any, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert time-series rows with a single executemany statement
+        
+        The insert is all-or-nothing: any failing row raises and the caller
+        rolls back. The caller owns the transaction and is responsible for
+        committing it.
+        
+        Args:
+            db: Database session
+            upload_id: ID of the parent DataUpload
+            user_id: ID of the owning user
+            rows: Row dictionaries as produced by to_records
+            
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        
+        # Raw random bytes skip UUID object construction; GUID binds them as-is.
+        # created_at is left to the server default.
+        params = [
+            {
+                "id": os.urandom(16),
+                "upload_id": upload_id,
+                "user_id": user_id,
+                **row,
+            }
+            for row in rows
+        ]
+        
+        db.execute(insert(TimeSeriesData), params)
+        logger.info(f"Bulk inserted {len(params)} time-series rows for upload {upload_id}")
+        return len(params)
@@ -0,0 +1,104 @@
+"""Tests for the request-scoped database session middleware"""
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+
+import src.database as database
+from src.database import db_session_context, get_db
+from src.middleware.db_session import DBSessionMiddleware
+
+
+class FakeSession:
+    """Records the transaction calls made by the middleware"""
+
+    def __init__(self):
+        self.calls = []
+
+    def commit(self):
+        self.calls.append("commit")
+
+    def rollback(self):
+        self.calls.append("rollback")
+
+    def close(self):
+        self.calls.append("close")
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Replace SessionLocal so every created session is captured"""
+    created = []
+
+    def factory():
+        session = FakeSession()
+        created.append(session)
+        return session
+
+    monkeypatch.setattr(database, "SessionLocal", factory)
+    return created
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(DBSessionMiddleware)
+
+    @app.get("/ok")
+    def ok(db=Depends(get_db), again=Depends(get_db)):
+        return {"shared": db is again}
+
+    @app.get("/missing")
+    def missing(db=Depends(get_db)):
+        raise HTTPException(status_code=404, detail="not found")
+
+    @app.get("/boom")
+    def boom(db=Depends(get_db)):
+        raise RuntimeError("boom")
+
+    @app.get("/no-db")
+    def no_db():
+        return {"status": "ok"}
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    return httpx.AsyncClient(transport=transport, base_url="http://test")
+
+
+class TestDBSessionMiddleware:
+    """Commit/rollback/close handling and ContextVar cleanup"""
+
+    async def test_commits_on_success(self, client, sessions):
+        response = await client.get("/ok")
+
+        assert response.status_code == 200
+        assert response.json() == {"shared": True}
+        assert len(sessions) == 1
+        assert sessions[0].calls == ["commit", "close"]
+
+    async def test_rolls_back_on_error_status(self, client, sessions):
+        response = await client.get("/missing")
+
+        assert response.status_code == 404
+        assert sessions[0].calls == ["rollback", "close"]
+
+    async def test_rolls_back_on_exception(self, client, sessions):
+        response = await client.get("/boom")
+
+        assert response.status_code == 500
+        assert sessions[0].calls == ["rollback", "close"]
+
+    async def test_no_session_when_database_unused(self, client, sessions):
+        response = await client.get("/no-db")
+
+        assert response.status_code == 200
+        assert sessions == []
+
+    async def test_context_is_reset_after_request(self, client, sessions):
+        await client.get("/ok")
+        await client.get("/boom")
+
+        assert db_session_context.get() is None
+
+    def test_get_db_requires_middleware(self):
+        with pytest.raises(RuntimeError):
+            get_db()
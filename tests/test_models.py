@@ -0,0 +1,67 @@
+"""Tests for custom column types"""
+
+import json
+
+import pytest
+from sqlalchemy.dialects import sqlite
+
+from src.models import EnumString, ModelType, MsgpackBlob, UserRole
+
+
+@pytest.fixture
+def blob():
+    return MsgpackBlob()
+
+
+def _round_trip(blob, value):
+    dialect = sqlite.dialect()
+    return blob.process_result_value(blob.process_bind_param(value, dialect), dialect)
+
+
+class TestMsgpackBlob:
+    """MsgpackBlob must store the same values stdlib JSON would"""
+
+    def test_round_trip_nested_payload(self, blob):
+        value = {"paths": [[1.0, 2.5], [3.0, None]], "meta": {"seed": 42, "ok": True}}
+
+        assert _round_trip(blob, value) == value
+
+    def test_non_string_keys_are_stringified_like_json(self, blob):
+        value = {1: 0.5, 2.5: "x", False: [1, 2], None: {"lag": {3: 0.1}}}
+
+        assert _round_trip(blob, value) == json.loads(json.dumps(value))
+
+    def test_tuples_become_lists(self, blob):
+        assert _round_trip(blob, {"range": (1, 2)}) == {"range": [1, 2]}
+
+    def test_unsupported_key_type_is_rejected(self, blob):
+        with pytest.raises(TypeError):
+            blob.process_bind_param({(1, 2): "pair"}, sqlite.dialect())
+
+    def test_none_passes_through(self, blob):
+        assert blob.process_bind_param(None, sqlite.dialect()) is None
+        assert blob.process_result_value(None, sqlite.dialect()) is None
+
+
+class TestEnumString:
+    """Enum columns load as enum members on SQLite, as on PostgreSQL"""
+
+    def test_round_trip_returns_enum_member(self):
+        column_type = EnumString(ModelType)
+        dialect = sqlite.dialect()
+
+        stored = column_type.process_bind_param(ModelType.ARIMA, dialect)
+        loaded = column_type.process_result_value(stored, dialect)
+
+        assert stored == "arima"
+        assert loaded is ModelType.ARIMA
+
+    def test_accepts_plain_values(self):
+        assert EnumString(UserRole).process_bind_param("user", sqlite.dialect()) == "user"
+
+    def test_rejects_unknown_values(self):
+        with pytest.raises(ValueError):
+            EnumString(UserRole).process_bind_param("root", sqlite.dialect())
+
+    def test_length_fits_longest_value(self):
+        assert EnumString(ModelType).impl_instance.length == len("linear_regression")
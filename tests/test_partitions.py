@@ -0,0 +1,42 @@
+"""Tests for automatic time-series partition creation"""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+import src.database as database
+
+
+@pytest.fixture
+def created(monkeypatch):
+    """Pretend to run on PostgreSQL and record requested partitions"""
+    calls = []
+
+    def fake_create(year, month):
+        calls.append((year, month))
+        return f"timeseries_data_{year:04d}_{month:02d}"
+
+    monkeypatch.setattr(database, "engine", SimpleNamespace(dialect=SimpleNamespace(name="postgresql")))
+    monkeypatch.setattr(database, "create_timeseries_partition", fake_create)
+    return calls
+
+
+class TestEnsureTimeseriesPartitions:
+    """ensure_timeseries_partitions picks the current and next month"""
+
+    def test_current_and_next_month(self, created):
+        names = database.ensure_timeseries_partitions(date(2026, 10, 14))
+
+        assert created == [(2026, 10), (2026, 11)]
+        assert names == ["timeseries_data_2026_10", "timeseries_data_2026_11"]
+
+    def test_december_rolls_over_to_january(self, created):
+        database.ensure_timeseries_partitions(date(2026, 12, 31))
+
+        assert created == [(2026, 12), (2027, 1)]
+
+    def test_noop_outside_postgresql(self, monkeypatch):
+        monkeypatch.setattr(database, "engine", SimpleNamespace(dialect=SimpleNamespace(name="sqlite")))
+
+        assert database.ensure_timeseries_partitions(date(2026, 10, 14)) == []
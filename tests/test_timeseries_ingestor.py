@@ -0,0 +1,91 @@
+"""Tests for bulk time-series ingestion"""
+
+import uuid
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.database import Base
+from src.models import DataUpload, TimeSeriesData, User, UserRole
+from src.services.data import DataValidator, TimeSeriesIngestor
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite session with all tables created"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def upload(db):
+    """Persisted user and upload that time-series rows can reference"""
+    user = User(
+        id=uuid.uuid4(),
+        username="ingest",
+        email="ingest@example.com",
+        hashed_password="x",
+        role=UserRole.ANALYST,
+    )
+    upload = DataUpload(id=uuid.uuid4(), user=user, filename="prices.csv", data_type="time_series")
+    db.add(upload)
+    db.flush()
+    return upload
+
+
+def _mixed_format_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "timestamp": ["2024-01-01", "2024-01-02 10:30:00", "01/03/2024"],
+        "symbol": ["AAPL", "AAPL", "AAPL"],
+        "open_price": [10.0, 11.0, 12.0],
+        "high_price": [12.0, 13.0, 14.0],
+        "low_price": [9.0, 10.0, 11.0],
+        "close_price": [11.0, 12.0, 13.0],
+        "volume": [100, 200, 300],
+    })
+
+
+class TestTimeSeriesIngestor:
+    """TimeSeriesIngestor.to_records and bulk_insert"""
+
+    def test_mixed_timestamp_formats_without_adjusted_close(self, db, upload):
+        valid_df, report = DataValidator.validate_timeseries_data(_mixed_format_frame())
+        assert report["valid_rows"] == 3
+
+        rows = TimeSeriesIngestor.to_records(valid_df)
+        assert [row["timestamp"] for row in rows] == [
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 2, 10, 30),
+            datetime(2024, 1, 3),
+        ]
+        assert all(row["adjusted_close"] is None for row in rows)
+
+        stored = TimeSeriesIngestor.bulk_insert(db, upload.id, upload.user_id, rows)
+        db.commit()
+
+        assert stored == 3
+        saved = db.query(TimeSeriesData).order_by(TimeSeriesData.timestamp).all()
+        assert len(saved) == 3
+        assert all(isinstance(row.id, uuid.UUID) for row in saved)
+        assert [row.volume for row in saved] == [100, 200, 300]
+        assert all(row.adjusted_close is None for row in saved)
+
+    def test_missing_adjusted_close_values_become_null(self):
+        df = _mixed_format_frame()
+        df["adjusted_close"] = [11.0, None, 13.0]
+
+        rows = TimeSeriesIngestor.to_records(df)
+
+        assert [row["adjusted_close"] for row in rows] == [11.0, None, 13.0]
+
+    def test_empty_rows_insert_nothing(self, db, upload):
+        assert TimeSeriesIngestor.bulk_insert(db, upload.id, upload.user_id, []) == 0